@@ -7,16 +7,31 @@
 # ======================================================================================================================
 
 # Standard libraries
-from typing import Tuple, List, Optional, Deque
+from typing import Tuple, List, Optional, Dict, Callable, TYPE_CHECKING
 from random import randrange, shuffle
-from datetime import datetime
-from time import sleep
+from enum import Enum, auto
 from pathlib import Path
-from _collections import deque
+from functools import partial
 
 # External libraries and modules
 import pygame
-from external_modules.pyvidplayer.pyvidplayer import Video
+
+# The video player pulls in ffmpeg, so it is only imported when the end video is loaded
+if TYPE_CHECKING:
+    from external_modules.pyvidplayer.pyvidplayer import Video
+
+
+# ======================================================================================================================
+# Functions
+# ======================================================================================================================
+
+def point_in_circle(point_x: int, point_y: int, center_x: int, center_y: int, radius_squared: int) -> bool:
+    """ Function to check if given point belongs to the circle defined by its center and squared radius """
+
+    dx: int = point_x - center_x
+    dy: int = point_y - center_y
+
+    return dx * dx + dy * dy <= radius_squared
 
 
 # ======================================================================================================================
@@ -26,6 +41,32 @@ from external_modules.pyvidplayer.pyvidplayer import Video
 class Sun:
     """ Class to implement the Sun """
 
+    __slots__ = (
+        "screen_width",
+        "screen_height",
+        "_radius",
+        "_radius_sq",
+        "_center_location",
+        "_random_x",
+        "_random_y",
+        "sun_color",
+        "sun_reducing_value",
+        "sun_surface",
+        "sun_rect",
+        "_sun_radii",
+        "_sun_radii_cursor",
+        "_number_of_sun_radii"
+    )
+
+    # Sun surfaces already drawn, by radius and color, shared by all the Sun instances
+    _SURFACE_CACHE: Dict[Tuple[int, Tuple[int, int, int]], pygame.surface.Surface] = {}
+
+    # White discs on a black background already drawn, by radius, from which the sun surfaces of any color are tinted
+    _DISC_CACHE: Dict[int, pygame.surface.Surface] = {}
+
+    # Transparent color of the sun surfaces, i.e. their background (the sun color must then not be black)
+    _COLORKEY: Tuple[int, int, int] = (0, 0, 0)
+
     def __init__(self, screen_width: int, screen_height: int, radius: int = 60) -> None:
         """ Class constructor """
 
@@ -33,40 +74,94 @@ class Sun:
         self.screen_height: int = screen_height
 
         self._radius: int = radius
-        self._center_location: List[int] = [0, 0]
+        self._radius_sq: int = radius * radius
+        self._center_location: Tuple[int, int] = (0, 0)
+
+        # Random sun center coordinates generators, their bounds depending on the radius
+        self._random_x: Callable[[], int] = partial(randrange, radius, screen_width - radius)
+        self._random_y: Callable[[], int] = partial(randrange, radius, screen_height - radius)
 
         self.sun_color: Tuple[int, int, int] = (250, 250, 0)
         self.sun_reducing_value: int = 2
 
         self.sun_surface: Optional[pygame.surface.Surface] = None
-        self.sun_circle: Optional[pygame.rect.Rect] = None
-        self.sun_rect: Optional[pygame.rect.Rect] = None
+        # The same Rect object is moved (and resized) along with the sun
+        self.sun_rect: pygame.rect.Rect = pygame.rect.Rect(0, 0, 0, 0)
 
-        self._sun_radii: Optional[Deque[int]] = None
+        self._sun_radii: Optional[List[int]] = None
+        self._sun_radii_cursor: int = 0  # index of the next radius to pick up from the Sun radii list
         self._number_of_sun_radii: int = 0
 
         self.initialize_sun_radii()
 
+        self.__update_surface()
         self.update()
 
-    def update(self) -> None:
-        """ Private method to draw the circle in the sun surface """
+    def __set_radius(self, new_radius: int) -> None:
+        """ Private method to set the sun radius and the values depending on it """
 
-        self.sun_surface = pygame.surface.Surface((self._radius * 2, self._radius * 2), pygame.SRCALPHA)
+        self._radius = new_radius
+        self._radius_sq = new_radius * new_radius
+        self._random_x = partial(randrange, new_radius, self.screen_width - new_radius)
+        self._random_y = partial(randrange, new_radius, self.screen_height - new_radius)
 
-        self.sun_circle = pygame.draw.circle(
-            self.sun_surface,
-            self.sun_color,
-            (self.sun_surface.get_width() / 2, self.sun_surface.get_height() / 2),
-            self._radius
-        )
+        self.__update_surface()
 
-        self._center_location = [
-            randrange(self._radius, self.screen_width - self._radius),
-            randrange(self._radius, self.screen_height - self._radius)
-        ]
+    def __get_disc(self, radius: int) -> pygame.surface.Surface:
+        """ Private method to get the white disc matching given radius, the circle being drawn once per radius """
+
+        disc: Optional[pygame.surface.Surface] = self._DISC_CACHE.get(radius)
+
+        if disc is None:
+            disc = pygame.surface.Surface((radius * 2, radius * 2))
+            disc.fill(self._COLORKEY)
+
+            pygame.draw.circle(
+                disc,
+                (255, 255, 255),
+                (radius, radius),
+                radius
+            )
 
-        self.sun_rect = self.sun_surface.get_rect(center=self._center_location)
+            self._DISC_CACHE[radius] = disc
+
+        return disc
+
+    def __get_surface(self, radius: int) -> pygame.surface.Surface:
+        """ Private method to get the sun surface matching given radius and the sun color, built once per radius/color """
+
+        cache_key: Tuple[int, Tuple[int, int, int]] = (radius, self.sun_color)
+        sun_surface: Optional[pygame.surface.Surface] = self._SURFACE_CACHE.get(cache_key)
+
+        if sun_surface is None:
+            # The white disc is tinted with the sun color, its black background remaining black
+            sun_surface = self.__get_disc(radius).copy()
+            sun_surface.fill(self.sun_color, special_flags=pygame.BLEND_MULT)
+
+            # A colorkey makes the background transparent: as the disc is opaque, there is no need for the slower per
+            # pixel alpha blits
+            sun_surface.set_colorkey(self._COLORKEY, pygame.RLEACCEL)
+
+            # Converting to the display pixel format enables the fast blit path (requires the display to be set)
+            if pygame.display.get_surface() is not None:
+                sun_surface = sun_surface.convert()
+
+            self._SURFACE_CACHE[cache_key] = sun_surface
+
+        return sun_surface
+
+    def __update_surface(self) -> None:
+        """ Private method to set the sun surface matching the current radius """
+
+        self.sun_surface = self.__get_surface(self._radius)
+        self.sun_rect.size = self.sun_surface.get_size()
+
+    def update(self) -> None:
+        """ Method to move the sun to a new random location """
+
+        self._center_location = (self._random_x(), self._random_y())
+
+        self.sun_rect.center = self._center_location
 
     @property
     def radius(self) -> int:
@@ -74,6 +169,12 @@ class Sun:
 
         return self._radius
 
+    @property
+    def radius_squared(self) -> int:
+        """ Property to return the squared sun radius """
+
+        return self._radius_sq
+
     def change_radius(self, first_game_phase: bool, second_game_phase: bool) -> bool:
         """
         Method to change Sun size
@@ -91,20 +192,20 @@ class Sun:
 
         if first_game_phase and not second_game_phase:
             if self._radius > self.sun_reducing_value:
-                self._radius -= self.sun_reducing_value
+                self.__set_radius(self._radius - self.sun_reducing_value)
                 self.update()
                 return True
 
             return False
 
         if not first_game_phase and second_game_phase:
-            try:
-                self._radius = self._sun_radii.popleft()
+            if self._sun_radii_cursor < self._number_of_sun_radii:
+                self.__set_radius(self._sun_radii[self._sun_radii_cursor])
+                self._sun_radii_cursor += 1
                 self.update()
                 return True
 
-            except IndexError:
-                return False
+            return False
 
     @property
     def sun_center_x(self) -> int:
@@ -129,15 +230,38 @@ class Sun:
             )
         )
         shuffle(self._sun_radii)
-        self._sun_radii = deque([self.radius] + self._sun_radii)
+        self._sun_radii.insert(0, self.radius)
+        self._sun_radii_cursor = 0
         self._number_of_sun_radii = len(self._sun_radii)
 
+        # The sun surfaces of all the radii used during the game are built here, once, instead of during the game
+        for radius in self._sun_radii:
+            self.__get_surface(radius)
+
 
 class MessageToDisplay:
     """ Class to implement a message that can be displayed on the screen """
 
-    def __init__(self, screen_width: int, screen_height: int) -> None:
-        """ Class constructor """
+    __slots__ = (
+        "screen_width",
+        "screen_height",
+        "font_policy",
+        "font_size",
+        "font_color",
+        "text_font",
+        "message_surface",
+        "message_rect",
+        "_displayed_text",
+        "_render_cache",
+        "_lines_render_cache"
+    )
+
+    def __init__(self, screen_width: int, screen_height: int, known_texts: Optional[List[str]] = None) -> None:
+        """
+        Class constructor
+
+        The known texts, if given, are rendered once here so that displaying them later is a simple lookup
+        """
 
         self.screen_width: int = screen_width
         self.screen_height: int = screen_height
@@ -158,43 +282,92 @@ class MessageToDisplay:
 
         self._displayed_text: str = ""
 
-        self._center_location: List[int] = [0, 0]
+        # Messages already rendered, by text
+        self._render_cache: Dict[str, Tuple[pygame.surface.Surface, pygame.rect.Rect]] = {}
 
-    def update(self) -> None:
-        """ Private method to initialize message Surface object """
+        # Lines already rendered, by text, so that messages sharing lines do not render them again
+        self._lines_render_cache: Dict[str, pygame.surface.Surface] = {}
+
+        if known_texts:
+            self.prerender_texts(known_texts)
+
+    def __render_line(self, line: str) -> pygame.surface.Surface:
+        """ Private method to render given line of text, the line being rendered once """
+
+        line_surface: Optional[pygame.surface.Surface] = self._lines_render_cache.get(line)
+
+        if line_surface is None:
+            line_surface = self.text_font.render(line, True, self.font_color)
+            self._lines_render_cache[line] = line_surface
+
+        return line_surface
+
+    def __render_text(self, text: str) -> Tuple[pygame.surface.Surface, pygame.rect.Rect]:
+        """ Private method to render given text, returns the message Surface object and its centered Rect """
+
+        message_surface: pygame.surface.Surface
 
-        if len(self._displayed_text.splitlines()) == 1:
-            self.message_surface = self.text_font.render(self._displayed_text, True, self.font_color)
-            self._center_location = [self.screen_width / 2, self.screen_height / 2]
-            self.message_rect = self.message_surface.get_rect(center=self._center_location)
+        if len(text.splitlines()) == 1:
+            message_surface = self.__render_line(text)
+
+            if pygame.display.get_surface() is not None:
+                message_surface = message_surface.convert_alpha()
 
         else:
-            lines: List[str] = self._displayed_text.splitlines()
+            lines: List[str] = text.splitlines()
 
             line_surface: pygame.Surface
             lines_surfaces: List[pygame.Surface] = []
             line: str
 
+            # Compute message surface width and height while rendering the lines
+            message_surface_width: int = 0
+            message_surface_height: int = 0
+
             for line in lines:
-                line_surface = self.text_font.render(line, True, self.font_color)
+                line_surface = self.__render_line(line)
                 lines_surfaces.append(line_surface)
 
-            # Compute message surface width and height
-            message_surface_width: int = max([line_surface.get_width() for line_surface in lines_surfaces])
-            message_surface_height: int = sum([line_surface.get_height() for line_surface in lines_surfaces])
+                message_surface_width = max(message_surface_width, line_surface.get_width())
+                message_surface_height += line_surface.get_height()
 
             # The SRCALPHA parameter enables to draw a transparent Surface
-            self.message_surface = pygame.Surface((message_surface_width, message_surface_height), pygame.SRCALPHA)
+            message_surface = pygame.Surface((message_surface_width, message_surface_height), pygame.SRCALPHA)
 
             for surface_index, current_line_surface in enumerate(lines_surfaces):
                 message_location: Tuple[int, int] = (
-                    (message_surface_width - current_line_surface.get_width()) / 2,
+                    (message_surface_width - current_line_surface.get_width()) // 2,
                     current_line_surface.get_height() * surface_index
                 )
-                self.message_surface.blit(current_line_surface, message_location)
+                message_surface.blit(current_line_surface, message_location)
+
+            # Same display pixel format conversion as for the sun surfaces
+            if pygame.display.get_surface() is not None:
+                message_surface = message_surface.convert_alpha()
+
+        center_location: Tuple[int, int] = (self.screen_width // 2, self.screen_height // 2)
 
-            self._center_location = [self.screen_width / 2, self.screen_height / 2]
-            self.message_rect = self.message_surface.get_rect(center=self._center_location)
+        return message_surface, message_surface.get_rect(center=center_location)
+
+    def prerender_texts(self, texts: List[str]) -> None:
+        """ Method to render given texts in advance, so that displaying them later does not render them again """
+
+        for text in texts:
+            if text not in self._render_cache:
+                self._render_cache[text] = self.__render_text(text)
+
+    def update(self) -> None:
+        """ Method to set the message Surface and Rect objects matching the text to display """
+
+        rendered_message: Optional[Tuple[pygame.surface.Surface, pygame.rect.Rect]] = self._render_cache.get(
+            self._displayed_text
+        )
+
+        if rendered_message is None:
+            rendered_message = self.__render_text(self._displayed_text)
+            self._render_cache[self._displayed_text] = rendered_message
+
+        self.message_surface, self.message_rect = rendered_message
 
     @property
     def displayed_text(self) -> str:
@@ -206,6 +379,9 @@ class MessageToDisplay:
     def displayed_text(self, new_text: str) -> None:
         """ Property setter to define new text to be displayed """
 
+        if new_text == self._displayed_text:
+            return None
+
         self._displayed_text = new_text
         self.update()
 
@@ -218,21 +394,44 @@ class GameSounds:
 
         self.sounds_location: Path = sounds_location
 
-        self.loaded_sounds: List[pygame.mixer.Sound] = []
+        # Sounds are only loaded (i.e. decoded) the first time they are played
+        self._loaded_sounds: Dict[Path, pygame.mixer.Sound] = {}
+
+        # Sounds paths shuffled once, then played in turn
+        self._shuffled_sounds_paths: Tuple[Path, ...] = ()
+        self._next_sound_index: int = 0
+
+        # A channel is reserved for the game sounds, so that playing them does not look for a free channel
+        pygame.mixer.set_reserved(1)
+        self._sounds_channel: pygame.mixer.Channel = pygame.mixer.Channel(0)
 
         self.__init_sounds()
 
     def __init_sounds(self) -> None:
-        """ Private method to initialize the game sounds """
+        """ Private method to initialize the game sounds paths """
 
-        for sound in self.sounds_location.glob("*.ogg"):
-            if sound.is_file():
-                self.loaded_sounds.append(pygame.mixer.Sound(sound))
+        sounds_paths: List[Path] = [sound for sound in self.sounds_location.glob("*.ogg") if sound.is_file()]
+        shuffle(sounds_paths)
+        self._shuffled_sounds_paths = tuple(sounds_paths)
 
-    def get_random_sound(self) -> pygame.mixer.Sound:
-        """ Method to get a random loaded sound """
+    def get_next_sound(self) -> pygame.mixer.Sound:
+        """ Method to get the next sound of the shuffled sounds cycle """
 
-        return self.loaded_sounds[randrange(0, len(self.loaded_sounds))]
+        sound_path: Path = self._shuffled_sounds_paths[self._next_sound_index]
+        self._next_sound_index = (self._next_sound_index + 1) % len(self._shuffled_sounds_paths)
+
+        sound: Optional[pygame.mixer.Sound] = self._loaded_sounds.get(sound_path)
+
+        if sound is None:
+            sound = pygame.mixer.Sound(sound_path)
+            self._loaded_sounds[sound_path] = sound
+
+        return sound
+
+    def play_next_sound(self) -> None:
+        """ Method to play the next sound of the shuffled sounds cycle on the reserved channel """
+
+        self._sounds_channel.play(self.get_next_sound())
 
 
 class GameMusics:
@@ -241,16 +440,24 @@ class GameMusics:
     def __init__(self, musics_locations: Path) -> None:
         """ Class constructor """
 
-        self._musics_locations: Path = musics_locations
         self._is_playing_music: bool = False
 
+        # Available musics locations, by music name
+        self._musics_paths: Dict[str, Path] = {
+            music_path.stem: music_path for music_path in musics_locations.glob("*.ogg") if music_path.is_file()
+        }
+        self._loaded_music_name: Optional[str] = None
+
     def play_chosen_music(self, music_name: str) -> None:
-        """ Method that plays the chosen music """
+        """ Method that plays the chosen music, the music file being loaded only if it is not the current one """
 
         if not self._is_playing_music:
-            music_location_path: Path = self._musics_locations / f"{music_name}.ogg"
-            if music_location_path.is_file():
-                pygame.mixer.music.load(str(music_location_path))
+            music_location_path: Optional[Path] = self._musics_paths.get(music_name)
+            if music_location_path is not None:
+                if music_name != self._loaded_music_name:
+                    pygame.mixer.music.load(str(music_location_path))
+                    self._loaded_music_name = music_name
+
                 pygame.mixer.music.play(-1)
                 self._is_playing_music = True
 
@@ -279,13 +486,15 @@ class GameVideos:
         self.screen_height: int = screen_height
         self.game_window: pygame.surface.Surface = game_window
 
-        self._current_playing_video: Optional[Video] = None
+        self._current_playing_video: Optional["Video"] = None
 
     def load_video(self, video_name: str) -> None:
-        """ Method that plays the chosen video """
+        """ Method that loads the chosen video """
 
         video_location_path: Path = self.videos_location / f"{video_name}.mp4"
         if video_location_path.is_file():
+            from external_modules.pyvidplayer.pyvidplayer import Video
+
             self._current_playing_video = Video(str(video_location_path))
             self._current_playing_video.set_size((self.screen_width, self.screen_height))
 
@@ -301,6 +510,26 @@ class GameVideos:
 
         if self._current_playing_video:
             self._current_playing_video.close()
+            self._current_playing_video = None
+
+
+class GameState(Enum):
+    """
+    Class to enumerate the game states
+
+    The states ending a level or a game phase last a single frame: once their message is rendered, the game enters the
+    matching message display state
+    """
+
+    PLAYING = auto()
+    LEVEL_WON = auto()  # sun clicked, the end of level message is to be rendered
+    LEVEL_LOST = auto()  # level time limit reached, the end of level message is to be rendered
+    FIRST_GAME_PHASE_WON = auto()  # all the first game phase levels won, the victory message is to be rendered
+    GAME_WON = auto()  # all the second game phase levels won, the victory message is to be rendered
+    SHOWING_END_LEVEL = auto()  # end of level message displayed, the level is paused
+    SHOWING_VICTORY = auto()  # victory message displayed, the game is paused
+    GAME_OVER = auto()  # game lost, the end of level message stays displayed until the game is quit
+    DONE = auto()  # game won, the end video follows
 
 
 class Game:
@@ -313,6 +542,11 @@ class Game:
         pygame.init()
         pygame.mixer.init()
 
+        # Only the handled events are queued by SDL, the other ones (mouse motion, window events, ...) are dropped
+        self.handled_events_types: Tuple[int, int] = (pygame.QUIT, pygame.MOUSEBUTTONDOWN)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.handled_events_types)
+
         # Define game clock
         self.game_clock = pygame.time.Clock()
 
@@ -321,7 +555,21 @@ class Game:
         self.screen_height: int = screen_height
 
         # Set main window
-        self.window: pygame.surface.Surface = pygame.display.set_mode((self.screen_width, self.screen_height))
+        # The SCALED flag routes the display through SDL2's GPU renderer, which honors the vsync request so that
+        # flip() waits for the monitor's vblank. Vsync may be unavailable (e.g. no renderer supporting it), in which
+        # case the game clock remains the only frame limiter.
+        # Trade-offs of the renderer: display.update(rects) presents the whole window (only the blits are limited to the
+        # dirty areas, see render), and SCALED enlarges the window by an integer factor on desktops large enough for it
+        try:
+            self.window: pygame.surface.Surface = pygame.display.set_mode(
+                (self.screen_width, self.screen_height),
+                pygame.SCALED | pygame.DOUBLEBUF,
+                vsync=1
+            )
+
+        except pygame.error:
+            self.window = pygame.display.set_mode((self.screen_width, self.screen_height))
+
         pygame.display.set_caption("Catch me if you can !")
 
         # Set data folders
@@ -333,7 +581,10 @@ class Game:
 
         # Background image
         self.background_image: Path = self.images_location / "ciel.jpg"
-        self.background: pygame.surface.Surface = pygame.image.load(str(self.background_image)).convert()
+        # The background is converted to the exact window pixel format, so that its blits use SDL's fast path
+        # (an image with transparency would need convert_alpha instead)
+        self.background: pygame.surface.Surface = pygame.image.load(str(self.background_image)).convert(self.window)
+        assert self.background.get_bitsize() == self.window.get_bitsize()
 
         # Game sounds
         self.game_sounds = GameSounds(self.sounds_locations)
@@ -349,157 +600,285 @@ class Game:
 
         # Sun configuration at game level
         self.sun_update_rate: int = 2  # in seconds
-        self.last_sun_location_update: datetime = datetime.now()
+        self.last_sun_location_update_ms: int = pygame.time.get_ticks()  # level start, in milliseconds
+        self.last_sun_move_ms: int = self.last_sun_location_update_ms  # in milliseconds
+
+        # Screen refresh: the whole screen is only redrawn when needed (first frame, after a message display),
+        # otherwise only the areas of the previous and current sun locations are, when the sun has moved
+        self.full_redraw: bool = True
+        self.sun_moved: bool = False
+        self.previous_sun_rect: pygame.rect.Rect = pygame.rect.Rect(0, 0, 0, 0)
+
+        # Messages texts
+        self.level_won_text: str = "Gagné !"
+        self.level_lost_text: str = "Perdu !"
+        self.first_game_phase_won_text: str = "\n".join(
+            [
+                "Tu as terminé le jeu, félicitations ^^",
+                "... enfin, peut-être :D",
+                "On recommence ?"
+            ]
+        )
+        self.game_won_text: str = "\n".join(
+            [
+                "Félicitations !!!",
+                "Cette fois tu as VRAIMENT terminé le jeu ^^",
+                "Voici ta récompense (c'est ta faute, Kev ^^) !"
+            ]
+        )
 
         # Initialize message to user
-        self.message_to_display = MessageToDisplay(self.screen_width, self.screen_height)
-        self.message_to_display.displayed_text = "Gagné !"
+        self.message_to_display = MessageToDisplay(
+            self.screen_width,
+            self.screen_height,
+            [self.level_won_text, self.level_lost_text, self.first_game_phase_won_text, self.game_won_text]
+        )
+        self.message_to_display.displayed_text = self.level_won_text
         self.message_display_time: int = 1  # in seconds
+        self.message_shown_at: int = 0  # in milliseconds, as returned by pygame.time.get_ticks
 
         # Other game variables
         self.level_time_limit: int = 2  # in seconds
-        self.FPS: int = 60  # number of frames per second
+        self.FPS: int = 30  # number of frames per second, the sun moving at most every few seconds
+        self.end_video_FPS: int = 60  # number of frames per second while playing the end video
+        self.end_game_wait_timeout: int = 200  # in milliseconds
 
         # Booleans
         self.running: bool = True
         self.running_end_video: bool = False
-        self.end_level: bool = False
-        self.end_game: bool = False
         self.first_game_phase: bool = True
         self.second_game_phase: bool = False
         self.victory: bool = False
 
-    def __initialize_some_games_booleans(self) -> None:
-        """ Method to initialize some game booleans """
+        # Game state and the matching render methods
+        self.state: GameState = GameState.PLAYING
+        self.render_methods: Dict[GameState, Callable[[], None]] = {
+            GameState.PLAYING: self.__render_playing,
+            GameState.LEVEL_WON: self.__render_level_won,
+            GameState.LEVEL_LOST: self.__render_level_lost,
+            GameState.FIRST_GAME_PHASE_WON: self.__render_first_game_phase_won,
+            GameState.GAME_WON: self.__render_game_won,
+            GameState.SHOWING_END_LEVEL: self.__render_nothing,
+            GameState.SHOWING_VICTORY: self.__render_nothing,
+            GameState.GAME_OVER: self.__render_nothing,
+            GameState.DONE: self.__render_nothing
+        }
 
-        self.end_level = False
-        self.end_game = False
-        self.victory = False
+    def process_input(self) -> None:
+        """ Method to process user input """
 
-    @staticmethod
-    def __does_point_belong_to_circle(current_point: Tuple[int, int], sun_instance: Sun) -> bool:
-        """ Static method to check if given point belongs to given circle """
+        events: List[pygame.event.Event] = pygame.event.get(self.handled_events_types)
 
-        return ((current_point[0] - sun_instance.sun_center_x) ** 2 + (current_point[1] - sun_instance.sun_center_y) ** 2) <= sun_instance.radius ** 2
+        # The sun does not change until a click hits it, which ends the level and disables the following clicks
+        sun_center_x: int = self.sun.sun_center_x
+        sun_center_y: int = self.sun.sun_center_y
+        sun_radius_squared: int = self.sun.radius_squared
 
-    def process_input(self) -> None:
-        """ Method to process user input """
+        # Event types are looked up once, not for each event
+        quit_event_type: int = pygame.QUIT
+        mouse_button_down_event_type: int = pygame.MOUSEBUTTONDOWN
 
-        for event in pygame.event.get():
+        for event in events:
             event_type: int = event.type
 
-            if event_type == pygame.QUIT:
+            if event_type == quit_event_type:
                 self.running = False
                 self.running_end_video = False
                 break
 
-            elif event_type == pygame.MOUSEBUTTONDOWN and not self.end_game:
-                mouse_center_location: Tuple[int, int] = pygame.mouse.get_pos()
+            elif event_type == mouse_button_down_event_type and self.state is GameState.PLAYING:
+                # The click location is carried by the event, no need to query the current mouse position
+                mouse_center_location: Tuple[int, int] = event.pos
 
-                if self.__does_point_belong_to_circle(mouse_center_location, self.sun):
+                if point_in_circle(
+                        mouse_center_location[0],
+                        mouse_center_location[1],
+                        sun_center_x,
+                        sun_center_y,
+                        sun_radius_squared
+                ):
 
-                    self.end_level = True
                     has_radius_changed: bool = self.sun.change_radius(self.first_game_phase, self.second_game_phase)
 
-                    if not has_radius_changed:
+                    if has_radius_changed:
+                        self.state = GameState.LEVEL_WON
+
+                    else:
                         self.victory = True
 
                         if self.second_game_phase:
                             self.second_game_phase = False
+                            self.message_to_display.displayed_text = self.game_won_text
+                            self.state = GameState.GAME_WON
 
                         if self.first_game_phase:
                             self.first_game_phase = False
                             self.second_game_phase = True
+                            self.message_to_display.displayed_text = self.first_game_phase_won_text
+                            self.state = GameState.FIRST_GAME_PHASE_WON
 
-    def render(self) -> None:
-        """ Method to render elements """
+    def __display_message(self, message_state: GameState) -> None:
+        """
+        Private method to display the current message over the screen and enter given message display state
 
-        if self.victory:
+        Only the message area is refreshed, the whole screen being redrawn once the message display is over.
+        The message stays displayed while the game loop keeps running, see check_message_display_time
+        """
 
-            if not self.first_game_phase and self.second_game_phase:
-                self.message_to_display.displayed_text = "\n".join(
-                    [
-                        "Tu as terminé le jeu, félicitations ^^",
-                        "... enfin, peut-être :D",
-                        "On recommence ?"
-                    ]
-                )
-                self.window.blit(self.message_to_display.message_surface, self.message_to_display.message_rect)
-                pygame.display.flip()
+        self.window.blit(self.message_to_display.message_surface, self.message_to_display.message_rect)
+        pygame.display.update(self.message_to_display.message_rect)
+        self.full_redraw = True
+
+        self.message_shown_at = pygame.time.get_ticks()
+        self.state = message_state
 
-                sleep(4 * self.message_display_time)
+    def __render_playing(self) -> None:
+        """ Private method to render the sun over the background, only refreshing what changed since last frame """
 
-                self.game_musics.play_chosen_music("fond_sonore_detente")
+        # The sun attributes are looked up once per frame
+        sun_surface: pygame.surface.Surface = self.sun.sun_surface
+        sun_rect: pygame.rect.Rect = self.sun.sun_rect
 
-                self.message_to_display.displayed_text = "Gagné !"
+        if self.full_redraw:
+            self.window.blits(((self.background, (0, 0)), (sun_surface, sun_rect)), doreturn=0)
+            pygame.display.flip()
+            self.previous_sun_rect.update(sun_rect)
+            self.full_redraw = False
+            self.sun_moved = False
+
+        # Only the sun areas are blitted again
+        elif self.sun_moved:
+            previous_sun_rect: pygame.rect.Rect = self.previous_sun_rect
+            self.window.blits(
+                ((self.background, previous_sun_rect, previous_sun_rect), (sun_surface, sun_rect)),
+                doreturn=0
+            )
+            pygame.display.update((previous_sun_rect, sun_rect))
+            previous_sun_rect.update(sun_rect)
+            self.sun_moved = False
 
-                self.sun.change_radius(self.first_game_phase, self.second_game_phase)
-                self.last_sun_location_update = datetime.now()
+    def __render_level_won(self) -> None:
+        """ Private method to render the end of level message, along with a sound during the second game phase """
 
-                self.__initialize_some_games_booleans()
+        self.__display_message(GameState.SHOWING_END_LEVEL)
 
-                return None
+        if self.second_game_phase:
+            self.game_sounds.play_next_sound()
 
-            elif not self.first_game_phase and not self.second_game_phase:
-                pygame.mixer.Sound.play(self.game_sounds.get_random_sound())
-                self.message_to_display.displayed_text = "\n".join(
-                    [
-                        "Félicitations !!!",
-                        "Cette fois tu as VRAIMENT terminé le jeu ^^",
-                        "Voici ta récompense (c'est ta faute, Kev ^^) !"
-                    ]
-                )
-                self.window.blit(self.message_to_display.message_surface, self.message_to_display.message_rect)
-                pygame.display.flip()
+    def __render_level_lost(self) -> None:
+        """ Private method to render the end of level message, the game being over """
 
-                sleep(4 * self.message_display_time)
+        self.__display_message(GameState.GAME_OVER)
 
-                self.running = False
-                self.running_end_video = True
+    def __render_first_game_phase_won(self) -> None:
+        """ Private method to render the first game phase victory message, the second game phase following it """
 
-                return None
+        self.__display_message(GameState.SHOWING_VICTORY)
 
-        if self.end_level:
-            self.window.blit(self.message_to_display.message_surface, self.message_to_display.message_rect)
-            pygame.display.flip()
+    def __render_game_won(self) -> None:
+        """ Private method to render the game victory message along with a sound, the game ending after it """
 
-            if not self.end_game and self.second_game_phase:
-                pygame.mixer.Sound.play(self.game_sounds.get_random_sound())
+        self.game_sounds.play_next_sound()
+        self.__display_message(GameState.SHOWING_VICTORY)
 
-            sleep(self.message_display_time)
+    def __render_nothing(self) -> None:
+        """ Private method to render nothing, the screen not changing in the current game state """
 
-            self.last_sun_location_update = datetime.now()
-            self.end_level = False
+    def render(self) -> None:
+        """ Method to render elements, according to the current game state """
 
-        if not self.end_game:
-            self.window.blit(self.background, (0, 0))
-            self.window.blit(self.sun.sun_surface, self.sun.sun_rect)
-            pygame.display.flip()
+        self.render_methods[self.state]()
 
     def change_sun_location(self) -> None:
         """ Method to change sun location with defined frequency """
 
-        if (datetime.now() - self.last_sun_location_update).seconds == self.level_time_limit:
-            self.message_to_display.displayed_text = "Perdu !"
-            self.end_level = True
-            self.end_game = True
+        now_ms: int = pygame.time.get_ticks()
+
+        if now_ms - self.last_sun_location_update_ms >= self.level_time_limit * 1000:
+            self.message_to_display.displayed_text = self.level_lost_text
+            self.state = GameState.LEVEL_LOST
 
-        if not self.end_game and (self.end_level or (datetime.now() - self.last_sun_location_update).seconds == self.sun_update_rate):
+        # A click on the sun already moves it (see Sun.change_radius), so it is only moved here on timer
+        elif now_ms - self.last_sun_move_ms >= self.sun_update_rate * 1000:
             self.sun.update()
+            self.last_sun_move_ms = now_ms
+            self.sun_moved = True
+
+    def __start_second_game_phase(self) -> None:
+        """ Private method to start the second game phase """
+
+        self.game_musics.play_chosen_music("fond_sonore_detente")
+
+        self.message_to_display.displayed_text = self.level_won_text
+
+        self.sun.change_radius(self.first_game_phase, self.second_game_phase)
+        self.last_sun_location_update_ms = pygame.time.get_ticks()
+        self.last_sun_move_ms = self.last_sun_location_update_ms
+
+        self.victory = False
+
+    def check_message_display_time(self) -> None:
+        """
+        Method to leave the message display states once the displayed message has been shown long enough
+
+        - After an end of level message, the next level starts
+        - After a victory message, either the second game phase starts or the game ends (and the end video starts)
+        """
+
+        if self.state is not GameState.SHOWING_END_LEVEL and self.state is not GameState.SHOWING_VICTORY:
+            return None
+
+        elapsed_time: int = pygame.time.get_ticks() - self.message_shown_at
+
+        if self.state is GameState.SHOWING_END_LEVEL and elapsed_time >= self.message_display_time * 1000:
+            self.last_sun_location_update_ms = pygame.time.get_ticks()
+            self.last_sun_move_ms = self.last_sun_location_update_ms
+            self.state = GameState.PLAYING
+
+        elif self.state is GameState.SHOWING_VICTORY and elapsed_time >= 4 * self.message_display_time * 1000:
+            if self.second_game_phase:
+                self.__start_second_game_phase()
+                self.state = GameState.PLAYING
+
+            else:
+                self.running = False
+                self.running_end_video = True
+                self.state = GameState.DONE
 
     def run(self) -> None:
         """ Method to run the game """
 
+        # Bound methods are looked up once, not at each frame
+        check_message_display_time = self.check_message_display_time
+        process_input = self.process_input
+        change_sun_location = self.change_sun_location
+        render = self.render
+        tick = self.game_clock.tick
+
         while self.running:
-            self.process_input()
-            self.change_sun_location()
-            self.render()
-            self.game_clock.tick(self.FPS)
+            check_message_display_time()
+            process_input()
+
+            if self.state is GameState.PLAYING:
+                change_sun_location()
+
+            render()
+
+            if self.state is GameState.GAME_OVER:
+                # Once the game is lost the screen does not change anymore: instead of running frames, the process
+                # sleeps until an event is received or the timeout is reached
+                if pygame.event.wait(self.end_game_wait_timeout).type == pygame.QUIT:
+                    self.running = False
+
+                continue
+
+            tick(self.FPS)
 
     def launch_end_video(self) -> None:
         """ Method to launch the end video if the player won the game"""
 
-        if self.victory:
+        # The game is only done once the final victory message has been displayed, not when quitting during it
+        if self.state is GameState.DONE:
             # Stop background music
             self.game_musics.stop_current_playing_music()
 
@@ -510,7 +889,7 @@ class Game:
             while self.running_end_video:
                 self.process_input()
                 self.game_videos.play_loaded_video()
-                self.game_clock.tick(self.FPS)
+                self.game_clock.tick(self.end_video_FPS)
 
     def quit_game(self) -> None:
         """ Method to correctly quit game """